@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from typing import Any, Optional
+
+# Per-user cache location, so nothing is written into processed projects
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "import-sorter",
+)
+
+# Bump whenever the shape or meaning of cached parse results changes
+CACHE_VERSION = 7
+
+# Entries kept by prune(); the least recently used ones are removed first
+MAX_ENTRIES = 5000
+
+
+def cache_key(source: str) -> str:
+    """
+    Build a cache key for the given source code.
+
+    Args:
+        source (str): Source code of the Python file
+
+    Returns:
+        str: Key combining the source hash, Python version and cache version
+    """
+    digest = hashlib.sha256(source.encode()).hexdigest()
+    return f"{digest}-py{sys.version_info[0]}{sys.version_info[1]}-v{CACHE_VERSION}"
+
+
+def load(key: str) -> Optional[Any]:
+    """
+    Load a cached JSON value and mark it as recently used.
+
+    Args:
+        key (str): Cache key
+
+    Returns:
+        Optional[Any]: Cached value, or None on a miss or unreadable entry
+    """
+    path = os.path.join(CACHE_DIR, key)
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            value = json.load(file)
+
+    except (OSError, ValueError):
+        return None
+
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+    return value
+
+
+def store(key: str, value: Any):
+    """
+    Store a value in the cache, ignoring failures.
+
+    Args:
+        key (str): Cache key
+        value (Any): JSON-serializable value to store
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR)
+
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(value, file)
+        os.replace(tmp_path, os.path.join(CACHE_DIR, key))
+
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def prune(max_entries: int = MAX_ENTRIES):
+    """
+    Remove the least recently used entries beyond max_entries.
+
+    Only lists the directory unless the cache is over its limit.
+
+    Args:
+        max_entries (int): Number of entries to keep
+    """
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+
+    if len(names) <= max_entries:
+        return
+
+    entries = []
+    for name in names:
+        path = os.path.join(CACHE_DIR, name)
+        try:
+            entries.append((os.stat(path).st_mtime, path))
+        except OSError:
+            pass
+
+    entries.sort()
+    for _, path in entries[: len(entries) - max_entries]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -1,6 +1,6 @@
+from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Optional
-from pydantic import BaseModel, Field, field_validator
 import os
 
 
@@ -21,49 +21,35 @@ class SortingType(Enum):
     STRUCTURAL = auto()
 
 
-class Config(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Config:
     """
     Configuration model for import sorter with validation.
 
-    Validates input parameters and provides type safety.
+    Validates input parameters on construction.
     """
 
-    directory: Optional[str] = Field(
-        default=None, description="Directory containing Python files to process"
-    )
-    file: Optional[str] = Field(default=None, description="Specific file to process")
-    sorting_type: SortingType = Field(
-        default=SortingType.STRUCTURAL, description="Import sorting strategy to apply"
-    )
-    verbose: bool = Field(default=False, description="Enable verbose logging")
-    dry_run: bool = Field(default=False, description="Enable dry-run")
-
-    @field_validator("directory", "file")
-    def validate_path(cls, path):
+    # Directory containing Python files to process
+    directory: Optional[str] = None
+    # Specific file to process
+    file: Optional[str] = None
+    # Import sorting strategy to apply
+    sorting_type: SortingType = SortingType.STRUCTURAL
+    # Enable verbose logging
+    verbose: bool = False
+    # Enable dry-run
+    dry_run: bool = False
+
+    def __post_init__(self):
         """
-        Validate that provided paths exist and are accessible.
-
-        Args:
-            path (str): File or directory path
+        Validate that provided paths exist and that file is a Python file.
 
         Raises:
-            ValueError: If path does not exist or is not readable
-        """
-        if path and not os.path.exists(path):
-            raise ValueError(f"Path does not exist: {path}")
-        return path
-
-    @field_validator("file")
-    def validate_file_extension(cls, file):
+            ValueError: If a path does not exist or file is not a Python file
         """
-        Ensure file has a .py extension.
+        for path in (self.directory, self.file):
+            if path and not os.path.exists(path):
+                raise ValueError(f"Path does not exist: {path}")
 
-        Args:
-            file (str): File path to validate
-
-        Raises:
-            ValueError: If file is not a Python file
-        """
-        if file and not file.endswith(".py"):
-            raise ValueError(f"File must be a Python file: {file}")
-        return file
+        if self.file and not self.file.endswith(".py"):
+            raise ValueError(f"File must be a Python file: {self.file}")
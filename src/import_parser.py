@@ -1,7 +1,19 @@
-import ast
-from typing import List
+import io
+import re
+import sys
+import tokenize
+from typing import Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
+
+import ast_cache
+
+# Top-level names of every standard library module
+STDLIB_SET = frozenset(sys.stdlib_module_names)
+
+# Lines that may start a top-level import statement
+_IMPORT_LINE = re.compile(r"^(?:import|from)\b", re.MULTILINE)
 
 
 class ImportType(Enum):
@@ -19,19 +31,50 @@ class ImportType(Enum):
     LOCAL = auto()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImportStatement:
     """
     Structured representation of a Python import statement.
 
     Captures details of import statements for further processing.
+    Instances are immutable and hashable.
     """
 
     original_line: str
     import_type: ImportType
     module: str
-    specific_imports: List[str] = field(default_factory=list)
+    specific_imports: Tuple[str, ...] = ()
     is_from_import: bool = False
+    # UTF-8 encoded original_line; compares in the same order, but faster
+    sort_key: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """
+        Precompute the byte sort key from the original line.
+        """
+        object.__setattr__(self, "sort_key", self.original_line.encode("utf-8"))
+
+
+@lru_cache(maxsize=4096)
+def _classify_import_type(module: str) -> ImportType:
+    """
+    Classify import type based on module name.
+
+    Args:
+        module (str): Module name to classify
+
+    Returns:
+        ImportType: Categorized import type
+    """
+    # Standard library check on the top-level package name
+    if module.partition(".")[0] in STDLIB_SET:
+        return ImportType.SYSTEM
+
+    # Local project import (contains no dots or starts with current project)
+    if "." not in module or module.startswith("."):
+        return ImportType.LOCAL
+
+    return ImportType.THIRD_PARTY
 
 
 class Parser:
@@ -40,38 +83,200 @@ class Parser:
     """
 
     @staticmethod
-    def parse_imports(file_path: str) -> List[ImportStatement]:
+    def parse_imports(
+        source: str, file_path: Optional[str] = None, write_cache: bool = True
+    ) -> List[ImportStatement]:
         """
-        Extract and categorize import statements from a Python file.
+        Extract and categorize import statements from Python source code.
+
+        Only module-level imports are collected. Results are cached on disk,
+        keyed by the source hash, so unchanged files skip parsing on
+        subsequent runs.
 
         Args:
-            file_path (str): Path to the Python file to parse
+            source (str): Source code of the Python file
+            file_path (Optional[str]): Path of the file, used in error messages
+            write_cache (bool): Store freshly parsed results in the cache
 
         Returns:
             List[ImportStatement]: Parsed and categorized import statements
         """
+        key = ast_cache.cache_key(source)
+        cached = Parser._from_rows(ast_cache.load(key))
+        if cached is not None:
+            return cached
+
         try:
-            with open(file_path, "r") as file:
-                tree = ast.parse(file.read())
+            imports = Parser._scan_imports(source)
 
-        except (IOError, SyntaxError) as e:
+        except (SyntaxError, tokenize.TokenError) as e:
             raise ValueError(f"Error parsing file {file_path}: {e}")
 
+        if write_cache:
+            ast_cache.store(key, Parser._to_rows(imports))
+        return imports
+
+    @staticmethod
+    def _to_rows(imports: List[ImportStatement]) -> List[list]:
+        """
+        Convert import statements into plain JSON-serializable rows.
+
+        Args:
+            imports (List[ImportStatement]): Parsed import statements
+
+        Returns:
+            List[list]: One row per import statement
+        """
+        return [
+            [
+                imp.original_line,
+                imp.import_type.name,
+                imp.module,
+                list(imp.specific_imports),
+                imp.is_from_import,
+            ]
+            for imp in imports
+        ]
+
+    @staticmethod
+    def _from_rows(rows: Any) -> Optional[List[ImportStatement]]:
+        """
+        Rebuild import statements from cached rows.
+
+        Args:
+            rows (Any): Value loaded from the cache
+
+        Returns:
+            Optional[List[ImportStatement]]: Import statements, or None if
+                the rows are missing or malformed
+        """
+        if not isinstance(rows, list):
+            return None
+
+        try:
+            return [
+                ImportStatement(
+                    original_line=line,
+                    import_type=ImportType[type_name],
+                    module=module,
+                    specific_imports=tuple(names),
+                    is_from_import=is_from,
+                )
+                for line, type_name, module, names, is_from in rows
+            ]
+
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _scan_imports(source: str) -> List[ImportStatement]:
+        """
+        Collect module-level imports by streaming tokens from the source.
+
+        Tokenizing stops at the first top-level statement after the last
+        line starting with 'import' or 'from', so the rest of the file
+        (usually nearly all of it) is never tokenized. As a consequence,
+        syntax errors after the imports are not detected and such files
+        are sorted like any other.
+
+        Args:
+            source (str): Source code of the Python file
+
+        Returns:
+            List[ImportStatement]: Parsed and categorized import statements
+        """
+        last_match = None
+        for last_match in _IMPORT_LINE.finditer(source):
+            pass
+
         imports = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(Parser._create_import_statement(alias.name))
-
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ""
-                for alias in node.names:
-                    imports.append(
-                        Parser._create_from_import_statement(module, alias.name)
-                    )
+        if last_match is None:
+            return imports
+
+        last_row = source.count("\n", 0, last_match.start()) + 1
+        depth = 0
+        in_statement = False
+        words = []
+        for token in tokenize.generate_tokens(io.StringIO(source).readline):
+            if token.type == tokenize.INDENT:
+                depth += 1
+            elif token.type == tokenize.DEDENT:
+                depth -= 1
+            elif depth or token.type in (tokenize.COMMENT, tokenize.NL):
+                continue
+            elif token.type in (tokenize.NEWLINE, tokenize.ENDMARKER) or (
+                token.type == tokenize.OP and token.string == ";"
+            ):
+                if words:
+                    imports.extend(Parser._create_statements(words))
+                in_statement = False
+                words = []
+            elif not in_statement:
+                if token.start[0] > last_row:
+                    break
+
+                in_statement = True
+                if token.type == tokenize.NAME and token.string in ("import", "from"):
+                    words.append(token.string)
+            elif words and token.string not in ("(", ")"):
+                words.append(token.string)
 
         return imports
 
+    @staticmethod
+    def _create_statements(words: List[str]) -> List[ImportStatement]:
+        """
+        Create import statements from the tokens of one import statement.
+
+        Args:
+            words (List[str]): Token strings, starting with 'import' or 'from'
+
+        Returns:
+            List[ImportStatement]: One import statement per imported name
+        """
+        if words[0] == "import":
+            return [
+                Parser._create_import_statement(module)
+                for module in Parser._split_names(words[1:])
+            ]
+
+        import_index = words.index("import")
+        module = "".join(words[1:import_index])
+        return [
+            Parser._create_from_import_statement(module, name)
+            for name in Parser._split_names(words[import_index + 1 :])
+        ]
+
+    @staticmethod
+    def _split_names(words: List[str]) -> List[str]:
+        """
+        Split a comma-separated list of imported names, dropping aliases.
+
+        Args:
+            words (List[str]): Token strings, e.g. ['os', '.', 'path', 'as', 'p']
+
+        Returns:
+            List[str]: Dotted names, e.g. ['os.path']
+        """
+        names = []
+        current = ""
+        aliased = False
+        for word in words:
+            if word == ",":
+                if current:
+                    names.append(current)
+                current = ""
+                aliased = False
+            elif word == "as":
+                aliased = True
+            elif not aliased:
+                current += word
+
+        if current:
+            names.append(current)
+
+        return names
+
     @staticmethod
     def _create_import_statement(module: str) -> ImportStatement:
         """
@@ -83,7 +288,7 @@ class Parser:
         Returns:
             ImportStatement: Parsed import statement
         """
-        import_type = Parser._classify_import_type(module)
+        import_type = _classify_import_type(module)
         return ImportStatement(
             original_line=f"import {module}",
             import_type=import_type,
@@ -105,34 +310,11 @@ class Parser:
         Returns:
             ImportStatement: Parsed from-import statement
         """
-        import_type = Parser._classify_import_type(module)
+        import_type = _classify_import_type(module)
         return ImportStatement(
             original_line=f"from {module} import {specific_import}",
             import_type=import_type,
             module=module,
-            specific_imports=[specific_import],
+            specific_imports=(specific_import,),
             is_from_import=True,
         )
-
-    @staticmethod
-    def _classify_import_type(module: str) -> ImportType:
-        """
-        Classify import type based on module name.
-
-        Args:
-            module (str): Module name to classify
-
-        Returns:
-            ImportType: Categorized import type
-        """
-        # Standard library check (simplistic approach)
-        standard_libs = ["os", "re", "sys", "math", "json", "datetime"]
-
-        if any(module.startswith(lib) for lib in standard_libs):
-            return ImportType.SYSTEM
-
-        # Local project import (contains no dots or starts with current project)
-        if "." not in module or module.startswith("."):
-            return ImportType.LOCAL
-
-        return ImportType.THIRD_PARTY
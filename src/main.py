@@ -1,13 +1,19 @@
 import os
 import sys
 import logging
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterator, List, Optional, Tuple
 
+import ast_cache
 from config import Config, SortingType
 from import_parser import Parser
 from sorting_strategies import Sorter
 from utils import setup_argparser
 
+# (file path, original import lines, sorted import lines, changed, error message)
+FileResult = Tuple[str, List[str], List[str], bool, Optional[str]]
+
 
 class ImportSorter:
     """
@@ -82,6 +88,8 @@ class ImportSorter:
         else:
             raise ValueError("Either --file or --directory must be specified")
 
+        ast_cache.prune()
+
     def _process_single_file(self, file_path: str, config: Config):
         """
         Process and sort imports for a single file.
@@ -90,67 +98,166 @@ class ImportSorter:
             file_path (str): Path to the Python file
             config (Config): Sorting configuration
         """
-        try:
-            # Read the entire file content
-            with open(file_path, "r") as file:
-                content = file.readlines()
-
-            # Seperate import statements
-            import_statements = []
-            non_import_content = []
-            for line in content:
-                stripped_line = line.strip()
-                if stripped_line.startswith(("import ", "from ")):
-                    import_statements.append(line)
-                else:
-                    non_import_content.append(line)
-
-            # Parse and sort imports
-            parsed_imports = Parser.parse_imports(file_path)
-            sorted_imports = Sorter.sort_imports(parsed_imports, config.sorting_type)
-
-            # Convert sorted imports back to lines
-            sorted_import_lines = [imp.original_line + "\n" for imp in sorted_imports]
-
-            # Combine sorted imports with rest of the content
-            new_content = sorted_import_lines + non_import_content
-
-            # Verbose logging
-            if config.verbose:
-                self.logger.info(f"Processing file: {file_path}")
-                self.logger.info("Original imports:")
-                for imp in import_statements:
-                    self.logger.info(imp[:-1])
-
-                self.logger.info("Sorted imports:")
-                for imp in sorted_import_lines:
-                    self.logger.info(imp[:-1])
-
-            # Write changes
-            if not config.dry_run:
-                with open(file_path, "w") as file:
-                    file.writelines(new_content)
-                self.logger.info(f"Successfully sorted imports in {file_path}")
-
-        except Exception as e:
-            self.logger.error(f"Error processing {file_path}: {e}")
+        self._report(
+            _sort_file(file_path, config.sorting_type, config.dry_run), config
+        )
 
     def _process_directory(self, directory: str, config: Config):
         """
         Process and sort imports for all Python files in a directory.
 
+        Files are independent of each other, so they are processed in
+        parallel worker processes and the results are reported here.
+
         Args:
             directory (str): Directory path
             config (Config): Sorting configuration
         """
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if file.endswith(".py"):
-                    file_path = os.path.join(root, file)
-                    try:
-                        self._process_single_file(file_path, config)
-                    except Exception as e:
-                        self.logger.error(f"Error processing {file_path}: {e}")
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(
+                _sort_file,
+                _iter_py_files(directory),
+                repeat(config.sorting_type),
+                repeat(config.dry_run),
+                chunksize=8,
+            )
+            for result in results:
+                self._report(result, config)
+
+    def _report(self, result: FileResult, config: Config):
+        """
+        Log the outcome of processing a single file.
+
+        Args:
+            result (FileResult): Outcome returned by _sort_file
+            config (Config): Sorting configuration
+        """
+        file_path, import_statements, sorted_import_lines, changed, error = result
+
+        if error is not None:
+            self.logger.error("Error processing %s: %s", file_path, error)
+            return
+
+        # Verbose logging, one record per file
+        if config.verbose and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Processing file: %s\nOriginal imports:\n%sSorted imports:\n%s",
+                file_path,
+                "".join(import_statements),
+                "".join(sorted_import_lines).rstrip("\n"),
+            )
+
+        if config.dry_run:
+            return
+
+        if changed:
+            self.logger.info("Successfully sorted imports in %s", file_path)
+        else:
+            self.logger.info("Imports already sorted in %s", file_path)
+
+
+def _iter_py_files(root: str) -> Iterator[str]:
+    """
+    Recursively yield paths of Python files under a directory.
+
+    Uses os.scandir so file types come from the directory entries
+    instead of extra stat calls. As with os.walk, symlinked directories
+    are not followed and unreadable directories are skipped.
+
+    Args:
+        root (str): Directory path
+
+    Yields:
+        str: Path of each Python file
+    """
+    try:
+        entries = os.scandir(root)
+
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_py_files(entry.path)
+            elif entry.name.endswith(".py") and entry.is_file():
+                yield entry.path
+
+
+def _sort_file(file_path: str, sorting_type: SortingType, dry_run: bool) -> FileResult:
+    """
+    Sort imports for a single file and write the result back if it changed.
+
+    Runs inside worker processes, so the outcome is returned to the
+    caller for logging instead of being logged here.
+
+    Args:
+        file_path (str): Path to the Python file
+        sorting_type (SortingType): Sorting strategy to apply
+        dry_run (bool): Skip writing changes when True
+
+    Returns:
+        FileResult: File path, original import lines, sorted import lines,
+            whether the content changed and an error message (None on success)
+    """
+    try:
+        # Read the entire file content once
+        with open(file_path, "r", encoding="utf-8") as file:
+            source = file.read()
+        content = source.splitlines(keepends=True)
+
+        # Seperate top-level import statements; indented imports belong to
+        # functions or guards and stay where they are
+        import_statements = []
+        non_import_content = []
+        for line in content:
+            if line.startswith(("import ", "from ")):
+                import_statements.append(line)
+            else:
+                non_import_content.append(line)
+
+        # Parse and sort imports
+        parsed_imports = Parser.parse_imports(
+            source, file_path, write_cache=not dry_run
+        )
+        sorted_imports = Sorter.sort_imports(parsed_imports, sorting_type)
+
+        # Convert sorted imports back to lines
+        sorted_import_lines = [imp.original_line + "\n" for imp in sorted_imports]
+
+        # Combine sorted imports with rest of the content
+        new_source = "".join(sorted_import_lines + non_import_content)
+        changed = new_source != source
+
+        # Write changes, leaving already sorted files untouched
+        if changed and not dry_run:
+            _write_file(file_path, new_source.encode("utf-8"))
+
+    except Exception as e:
+        return file_path, [], [], False, str(e)
+
+    return file_path, import_statements, sorted_import_lines, changed, None
+
+
+def _write_file(file_path: str, data: bytes):
+    """
+    Replace the contents of a file with a single buffer.
+
+    Writes go straight to the file descriptor, bypassing the text and
+    buffering layers, so a file is usually written with one syscall.
+
+    Args:
+        file_path (str): Path to the file
+        data (bytes): New file contents
+    """
+    fd = os.open(file_path, os.O_WRONLY | os.O_TRUNC | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+
+    finally:
+        os.close(fd)
 
 
 def main():
@@ -1,7 +1,52 @@
-from typing import List
+from itertools import islice
+from operator import attrgetter, le
+from typing import Any, List
 from import_parser import ImportStatement, ImportType
 from config import SortingType
 
+# Bucket index of each library type used by the structural sort
+_TYPE_ORDER = {
+    ImportType.SYSTEM: 0,
+    ImportType.THIRD_PARTY: 1,
+    ImportType.LOCAL: 2,
+}
+
+
+def _is_sorted(keys: List[Any]) -> bool:
+    """
+    Check whether sort keys are already in non-decreasing order.
+
+    Args:
+        keys (List[Any]): Sort keys
+
+    Returns:
+        bool: True if no reordering is needed
+    """
+    return all(map(le, keys, islice(keys, 1, None)))
+
+
+def _sort_by_keys(
+    keys: List[Any], imports: List[ImportStatement]
+) -> List[ImportStatement]:
+    """
+    Sort imports by precomputed keys.
+
+    Already sorted input is returned as is. Otherwise the original index
+    keeps ties from ever comparing ImportStatement objects.
+
+    Args:
+        keys (List[Any]): Sort key of each import statement
+        imports (List[ImportStatement]): Unsorted import statements
+
+    Returns:
+        List[ImportStatement]: Sorted import statements
+    """
+    if _is_sorted(keys):
+        return imports
+
+    keyed = sorted(zip(keys, range(len(imports)), imports))
+    return [item[-1] for item in keyed]
+
 
 class Sorter:
     """
@@ -15,6 +60,9 @@ class Sorter:
         """
         Sort import statements based on specified strategy.
 
+        Duplicate import lines are dropped before sorting, keeping the
+        first occurrence.
+
         Args:
             imports (List[ImportStatement]): List of import statements
             sorting_type (SortingType): Sorting strategy to apply
@@ -22,14 +70,12 @@ class Sorter:
         Returns:
             List[ImportStatement]: Sorted import statements
         """
-        strategy_map = {
-            SortingType.FROM_FIRST: Sorter._from_first_sort,
-            SortingType.IMPORT_FIRST: Sorter._import_first_sort,
-            SortingType.ALPHABETICAL: Sorter._alphabetical_sort,
-            SortingType.STRUCTURAL: Sorter._structural_sort,
-        }
+        unique = {}
+        for imp in imports:
+            unique.setdefault(imp.original_line, imp)
 
-        return strategy_map[sorting_type](imports)
+        imports = list(unique.values())
+        return _STRATEGY_MAP[sorting_type](imports)
 
     @staticmethod
     def _from_first_sort(imports: List[ImportStatement]) -> List[ImportStatement]:
@@ -42,7 +88,9 @@ class Sorter:
         Returns:
             List[ImportStatement]: Sorted import statements
         """
-        return sorted(imports, key=lambda x: (not x.is_from_import, x.original_line))
+        return _sort_by_keys(
+            [(not imp.is_from_import, imp.sort_key) for imp in imports], imports
+        )
 
     @staticmethod
     def _import_first_sort(imports: List[ImportStatement]) -> List[ImportStatement]:
@@ -55,7 +103,9 @@ class Sorter:
         Returns:
             List[ImportStatement]: Sorted import statements
         """
-        return sorted(imports, key=lambda x: (x.is_from_import, x.original_line))
+        return _sort_by_keys(
+            [(imp.is_from_import, imp.sort_key) for imp in imports], imports
+        )
 
     @staticmethod
     def _alphabetical_sort(imports: List[ImportStatement]) -> List[ImportStatement]:
@@ -68,7 +118,7 @@ class Sorter:
         Returns:
             List[ImportStatement]: Sorted import statements
         """
-        return sorted(imports, key=lambda x: x.original_line)
+        return _sort_by_keys([imp.sort_key for imp in imports], imports)
 
     @staticmethod
     def _structural_sort(imports: List[ImportStatement]) -> List[ImportStatement]:
@@ -81,12 +131,29 @@ class Sorter:
         Returns:
             List[ImportStatement]: Sorted import statements
         """
-        type_order = {
-            ImportType.SYSTEM: 0,
-            ImportType.THIRD_PARTY: 1,
-            ImportType.LOCAL: 2,
-        }
-
-        return sorted(
-            imports, key=lambda x: (type_order[x.import_type], x.original_line)
-        )
+        type_order = _TYPE_ORDER.__getitem__
+        if _is_sorted(
+            [(type_order(imp.import_type), imp.sort_key) for imp in imports]
+        ):
+            return imports
+
+        # Partition by library type in one pass, then sort each bucket
+        buckets = ([], [], [])
+        for imp in imports:
+            buckets[type_order(imp.import_type)].append(imp)
+
+        by_line = attrgetter("sort_key")
+        sorted_imports = []
+        for bucket in buckets:
+            bucket.sort(key=by_line)
+            sorted_imports.extend(bucket)
+
+        return sorted_imports
+
+
+_STRATEGY_MAP = {
+    SortingType.FROM_FIRST: Sorter._from_first_sort,
+    SortingType.IMPORT_FIRST: Sorter._import_first_sort,
+    SortingType.ALPHABETICAL: Sorter._alphabetical_sort,
+    SortingType.STRUCTURAL: Sorter._structural_sort,
+}
@@ -1,12 +1,19 @@
 import argparse
+from functools import cache
 
 from config import SortingType
 
+# Names accepted by --type
+_SORT_CHOICES = tuple(t.name.lower() for t in SortingType)
 
+
+@cache
 def setup_argparser() -> argparse.ArgumentParser:
     """
     Sets command line arguments.
 
+    The parser is built once and reused on later calls.
+
     Returns:
         argparse.ArgumentParser: Argument parser
     """
@@ -17,7 +24,7 @@ def setup_argparser() -> argparse.ArgumentParser:
     parser.add_argument("--file", help="Specific Python file to process")
     parser.add_argument(
         "--type",
-        choices=[t.name.lower() for t in SortingType],
+        choices=_SORT_CHOICES,
         default=SortingType.STRUCTURAL.name.lower(),
         help="Import sorting strategy",
     )
@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+import ast_cache  # noqa: E402
+
+# Sample input for running the sorter by hand, not a test module
+collect_ignore = ["test_import_sorter.py"]
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ast_cache, "CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path / "cache"
@@ -0,0 +1,67 @@
+import os
+
+import ast_cache
+from import_parser import Parser
+
+SOURCE = "import os\nfrom .pkg import (a as b, c)\n"
+
+
+def test_load_miss_returns_none():
+    assert ast_cache.load(ast_cache.cache_key(SOURCE)) is None
+
+
+def test_store_then_load_round_trips():
+    key = ast_cache.cache_key(SOURCE)
+    ast_cache.store(key, [["import os", "SYSTEM", "os", [], False]])
+    assert ast_cache.load(key) == [["import os", "SYSTEM", "os", [], False]]
+
+
+def test_key_changes_with_source():
+    assert ast_cache.cache_key(SOURCE) != ast_cache.cache_key(SOURCE + "\n")
+
+
+def test_parse_imports_hit_skips_scanning(monkeypatch):
+    expected = Parser.parse_imports(SOURCE)
+
+    def fail(source):
+        raise AssertionError("cache miss")
+
+    monkeypatch.setattr(Parser, "_scan_imports", staticmethod(fail))
+    assert Parser.parse_imports(SOURCE) == expected
+
+
+def test_corrupt_entry_is_a_miss(cache_dir):
+    key = ast_cache.cache_key(SOURCE)
+    cache_dir.mkdir()
+    (cache_dir / key).write_text("not json")
+    assert ast_cache.load(key) is None
+    assert Parser.parse_imports(SOURCE)[0].original_line == "import os"
+
+
+def test_malformed_rows_are_a_miss(cache_dir):
+    key = ast_cache.cache_key(SOURCE)
+    ast_cache.store(key, [["import os", "NOT_A_TYPE", "os", [], False]])
+    assert len(Parser.parse_imports(SOURCE)) == 3
+
+
+def test_parse_imports_without_write_cache_stores_nothing():
+    Parser.parse_imports(SOURCE, write_cache=False)
+    assert ast_cache.load(ast_cache.cache_key(SOURCE)) is None
+
+
+def test_prune_removes_least_recently_used(cache_dir):
+    for i in range(5):
+        ast_cache.store(f"key{i}", i)
+        os.utime(cache_dir / f"key{i}", (i, i))
+
+    # Loading refreshes an old entry so it survives pruning
+    assert ast_cache.load("key0") == 0
+    ast_cache.prune(max_entries=2)
+
+    assert sorted(os.listdir(cache_dir)) == ["key0", "key4"]
+
+
+def test_prune_under_limit_keeps_everything(cache_dir):
+    ast_cache.store("key", 1)
+    ast_cache.prune(max_entries=1)
+    assert os.listdir(cache_dir) == ["key"]
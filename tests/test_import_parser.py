@@ -0,0 +1,114 @@
+import ast
+import glob
+import os
+
+import pytest
+
+import ast_cache
+from import_parser import ImportType, Parser
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "src")
+
+
+def lines(source):
+    return [imp.original_line for imp in Parser._scan_imports(source)]
+
+
+def test_parenthesised_import():
+    source = "from a.b import (\n    c,\n    d as e,\n)\n"
+    assert lines(source) == ["from a.b import c", "from a.b import d"]
+
+
+def test_backslash_continued_import():
+    assert lines("import os, \\\n    sys\n") == ["import os", "import sys"]
+
+
+def test_aliases_are_dropped():
+    source = "import numpy as np, os.path as osp\nfrom x import y as z\n"
+    assert lines(source) == ["import numpy", "import os.path", "from x import y"]
+
+
+def test_relative_imports_keep_their_dots():
+    source = "from . import a\nfrom .. import b\nfrom ...pkg.mod import c\n"
+    assert lines(source) == [
+        "from . import a",
+        "from .. import b",
+        "from ...pkg.mod import c",
+    ]
+
+
+def test_star_import():
+    assert lines("from x import *\n") == ["from x import *"]
+
+
+def test_semicolon_separated_statements():
+    assert lines("import os; import sys\n") == ["import os", "import sys"]
+
+
+def test_nested_imports_are_not_collected():
+    source = (
+        "import os\n"
+        "if TYPE_CHECKING:\n"
+        "    import a\n"
+        "try:\n"
+        "    import b\n"
+        "except ImportError:\n"
+        "    pass\n"
+        "def f():\n"
+        "    import c\n"
+        "class K:\n"
+        "    from d import e\n"
+    )
+    assert lines(source) == ["import os"]
+
+
+def test_docstring_line_starting_with_from():
+    source = '"""Module docs.\nfrom here on\n"""\nimport os\nx = """\nimport y\n"""\n'
+    assert lines(source) == ["import os"]
+
+
+def test_imports_after_code():
+    source = "import os\nsys.path.insert(0, 'lib')\nimport local\n"
+    assert lines(source) == ["import os", "import local"]
+
+
+def test_scan_stops_after_last_import():
+    # The unterminated bracket would fail tokenizing if it were reached
+    assert lines("import os\nx = (\n") == ["import os"]
+
+
+def test_no_imports():
+    assert lines("print('hi')\n") == []
+
+
+def test_classification():
+    imports = Parser._scan_imports("import os.path\nimport numpy.linalg\nimport app\n")
+    assert [imp.import_type for imp in imports] == [
+        ImportType.SYSTEM,
+        ImportType.THIRD_PARTY,
+        ImportType.LOCAL,
+    ]
+
+
+def test_syntax_error_raises_value_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(ast_cache, "CACHE_DIR", str(tmp_path))
+    with pytest.raises(ValueError):
+        Parser.parse_imports("import (\n", "bad.py")
+
+
+@pytest.mark.parametrize(
+    "path", sorted(glob.glob(os.path.join(SRC_DIR, "*.py"))), ids=os.path.basename
+)
+def test_matches_ast_module_level_imports(path):
+    with open(path, encoding="utf-8") as file:
+        source = file.read()
+
+    expected = []
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Import):
+            expected += [f"import {alias.name}" for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            module = "." * node.level + (node.module or "")
+            expected += [f"from {module} import {alias.name}" for alias in node.names]
+
+    assert lines(source) == expected
@@ -0,0 +1,88 @@
+import os
+
+import main
+from config import SortingType
+
+
+def test_iter_py_files_finds_nested_python_files(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.py").write_text("")
+    (tmp_path / "notes.txt").write_text("")
+    (tmp_path / "sub" / "b.py").write_text("")
+
+    assert sorted(main._iter_py_files(str(tmp_path))) == [
+        str(tmp_path / "a.py"),
+        str(tmp_path / "sub" / "b.py"),
+    ]
+
+
+def test_iter_py_files_skips_unreadable_directories(tmp_path, monkeypatch):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.py").write_text("")
+    (tmp_path / "sub" / "b.py").write_text("")
+
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if path == str(tmp_path / "sub"):
+            raise PermissionError(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    assert list(main._iter_py_files(str(tmp_path))) == [str(tmp_path / "a.py")]
+
+
+UNSORTED = "import sys\nimport os\n\nprint(os, sys)\n"
+SORTED = "import os\nimport sys\n\nprint(os, sys)\n"
+
+
+def fail_write(file_path, data):
+    raise AssertionError(f"unexpected write to {file_path}")
+
+
+def test_sort_file_leaves_already_sorted_file_untouched(tmp_path, monkeypatch):
+    path = tmp_path / "sorted.py"
+    path.write_text(SORTED)
+    os.utime(path, (1_000_000, 1_000_000))
+    monkeypatch.setattr(main, "_write_file", fail_write)
+
+    result = main._sort_file(str(path), SortingType.ALPHABETICAL, False)
+
+    assert result[3] is False
+    assert result[4] is None
+    assert path.read_text() == SORTED
+    assert os.stat(path).st_mtime == 1_000_000
+
+
+def test_sort_file_dry_run_never_writes(tmp_path, monkeypatch):
+    path = tmp_path / "unsorted.py"
+    path.write_text(UNSORTED)
+    monkeypatch.setattr(main, "_write_file", fail_write)
+
+    result = main._sort_file(str(path), SortingType.ALPHABETICAL, True)
+
+    assert result[3] is True
+    assert result[4] is None
+    assert path.read_text() == UNSORTED
+
+
+def test_sort_file_writes_changed_file_exactly(tmp_path):
+    path = tmp_path / "unsorted.py"
+    path.write_text("import sys\nimport os\n\ndef f():\n    return 'é'\n")
+
+    result = main._sort_file(str(path), SortingType.ALPHABETICAL, False)
+
+    assert result[3] is True
+    assert result[4] is None
+    assert path.read_bytes() == (
+        "import os\nimport sys\n\ndef f():\n    return 'é'\n".encode("utf-8")
+    )
+
+
+def test_write_file_replaces_longer_content(tmp_path):
+    path = tmp_path / "file.py"
+    path.write_bytes(b"x" * 100)
+
+    main._write_file(str(path), b"short\n")
+
+    assert path.read_bytes() == b"short\n"
@@ -0,0 +1,113 @@
+import pytest
+
+from config import SortingType
+from import_parser import ImportStatement, ImportType, Parser
+from sorting_strategies import _STRATEGY_MAP, Sorter
+
+SOURCE = (
+    "from sklearn.neighbors import KNeighborsClassifier\n"
+    "import os\n"
+    "from .local import helper\n"
+    "import flask\n"
+    "from collections import OrderedDict\n"
+    "import app\n"
+)
+
+EXPECTED = {
+    SortingType.STRUCTURAL: [
+        "from collections import OrderedDict",
+        "import os",
+        "from sklearn.neighbors import KNeighborsClassifier",
+        "from .local import helper",
+        "import app",
+        "import flask",
+    ],
+    SortingType.ALPHABETICAL: [
+        "from .local import helper",
+        "from collections import OrderedDict",
+        "from sklearn.neighbors import KNeighborsClassifier",
+        "import app",
+        "import flask",
+        "import os",
+    ],
+    SortingType.FROM_FIRST: [
+        "from .local import helper",
+        "from collections import OrderedDict",
+        "from sklearn.neighbors import KNeighborsClassifier",
+        "import app",
+        "import flask",
+        "import os",
+    ],
+    SortingType.IMPORT_FIRST: [
+        "import app",
+        "import flask",
+        "import os",
+        "from .local import helper",
+        "from collections import OrderedDict",
+        "from sklearn.neighbors import KNeighborsClassifier",
+    ],
+}
+
+
+def local_import(module):
+    return ImportStatement(
+        original_line=f"import {module}", import_type=ImportType.LOCAL, module=module
+    )
+
+
+@pytest.mark.parametrize("sorting_type", list(SortingType), ids=lambda t: t.name)
+def test_sorts_unsorted_input(sorting_type):
+    imports = Parser._scan_imports(SOURCE)
+    result = Sorter.sort_imports(imports, sorting_type)
+    assert [imp.original_line for imp in result] == EXPECTED[sorting_type]
+
+
+@pytest.mark.parametrize("sorting_type", list(SortingType), ids=lambda t: t.name)
+def test_already_sorted_input_is_returned_as_is(sorting_type):
+    strategy = _STRATEGY_MAP[sorting_type]
+    imports = strategy(Parser._scan_imports(SOURCE))
+    assert strategy(imports) is imports
+
+
+@pytest.mark.parametrize("sorting_type", list(SortingType), ids=lambda t: t.name)
+def test_equal_keys_keep_input_order(sorting_type):
+    first = local_import("b")
+    second = local_import("b")
+    imports = [local_import("c"), first, second, local_import("a")]
+
+    result = _STRATEGY_MAP[sorting_type](imports)
+
+    assert [imp.module for imp in result] == ["a", "b", "b", "c"]
+    assert result[1] is first
+    assert result[2] is second
+
+
+@pytest.mark.parametrize("sorting_type", list(SortingType), ids=lambda t: t.name)
+def test_non_ascii_lines_sort_in_str_order(sorting_type):
+    modules = ["zeta", "été", "Ångström", "\U0001d518nicode", "alpha"]
+    imports = [local_import(module) for module in modules]
+
+    result = Sorter.sort_imports(imports, sorting_type)
+
+    assert [imp.original_line for imp in result] == sorted(
+        imp.original_line for imp in imports
+    )
+
+
+def test_duplicates_are_dropped_keeping_the_first_occurrence():
+    imports = Parser._scan_imports("import sys\nimport os\nimport os\n")
+    first_os = imports[1]
+
+    result = Sorter.sort_imports(imports, SortingType.ALPHABETICAL)
+
+    assert [imp.original_line for imp in result] == ["import os", "import sys"]
+    assert result[0] is first_os
+
+
+def test_duplicates_keep_their_first_position_when_already_sorted():
+    imports = Parser._scan_imports("import os\nimport sys\nimport os\n")
+
+    result = Sorter.sort_imports(imports, SortingType.ALPHABETICAL)
+
+    assert [imp.original_line for imp in result] == ["import os", "import sys"]
+    assert result[0] is imports[0]